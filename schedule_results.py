@@ -0,0 +1,115 @@
+# schedule_results.py
+from array import array
+
+# Metric columns and their array typecodes. Day counts and hours of the day fit
+# in a signed byte. Total hours and gap time do not: overlapping classes push
+# total hours up and gap time (span minus class time) down by the same amount.
+# ECTS come in half-credit steps and are exact in float32.
+METRIC_TYPES = {
+    "num_days": "b",
+    "gap_time": "h",
+    "max_consec": "b",
+    "total_hours": "h",
+    "total_ects": "f",
+    "earliest_start": "b",
+    "latest_end": "b",
+}
+
+# Metrics that take part in the penalty, in the same order as the sidebar sliders
+PENALTY_METRICS = ["num_days", "gap_time", "max_consec", "earliest_start", "latest_end"]
+
+MAX_COURSES = 64  # one bit per course in an unsigned 64-bit mask
+
+
+class TooManyCoursesError(ValueError):
+    """More candidate courses than fit in a schedule bitmask."""
+
+
+class ScheduleResults:
+    """Columnar store for valid schedules.
+
+    Each schedule is one row: a bitmask over `items` (the candidate
+    (code, course) pairs) plus one typed array per metric. Ranking reads the
+    columns through memoryviews and only builds an index permutation, so rows
+    are never copied. A (code, course) combo is only rebuilt for the schedule
+    actually being displayed or saved.
+    """
+
+    def __init__(self, items):
+        if len(items) > MAX_COURSES:
+            raise TooManyCoursesError(
+                f"At most {MAX_COURSES} candidate courses are supported, got {len(items)}. "
+                "Please exclude some courses or universities."
+            )
+        self.items = list(items)
+        self.masks = array("Q")
+        self.metrics = {name: array(t) for name, t in METRIC_TYPES.items()}
+        self.order = array("I")
+        self._penalty_terms = []
+
+    def __len__(self):
+        return len(self.masks)
+
+    def append(self, mask, num_days, gap_time, max_consec, total_hours,
+               total_ects, earliest_start, latest_end):
+        m = self.metrics
+        self.masks.append(mask)
+        m["num_days"].append(num_days)
+        m["gap_time"].append(gap_time)
+        m["max_consec"].append(max_consec)
+        m["total_hours"].append(total_hours)
+        m["total_ects"].append(total_ects)
+        m["earliest_start"].append(earliest_start)
+        m["latest_end"].append(latest_end)
+
+    def column(self, name):
+        """Read-only, zero-copy view of a metric column (in generation order)."""
+        return memoryview(self.metrics[name]).toreadonly()
+
+    def rank(self, penalty_weights):
+        """Min-max normalize the penalty metrics, weight them and sort.
+
+        `penalty_weights` follows PENALTY_METRICS. Fills `order` (row indices by
+        ascending penalty, ties kept in generation order); the per-row penalties
+        are not kept, summary() recomputes the one it needs.
+        """
+        self._penalty_terms = []
+        penalty = [0.0] * len(self)
+        for name, weight in zip(PENALTY_METRICS, penalty_weights):
+            column = self.column(name)
+            minv, maxv = min(column), max(column)
+            self._penalty_terms.append((name, weight, minv, maxv))
+            if maxv - minv > 0:
+                for i, val in enumerate(column):
+                    penalty[i] += weight * ((val - minv) / (maxv - minv))
+        self.order = array("I", sorted(range(len(penalty)), key=penalty.__getitem__))
+
+    def row(self, rank):
+        return self.order[rank] if self.order else rank
+
+    def combo(self, rank):
+        """Materialize the (code, course) tuple for the schedule at `rank`."""
+        mask = self.masks[self.row(rank)]
+        return tuple(item for bit, item in enumerate(self.items) if mask >> bit & 1)
+
+    def summary(self, rank):
+        """Plain-Python metrics for the schedule at `rank` (for display/saving).
+
+        ECTS and the penalty are recomputed at full precision for this one row,
+        so the values shown and saved do not carry float32 rounding.
+        """
+        row = self.row(rank)
+        summary = {name: column[row] for name, column in self.metrics.items()}
+        summary["total_ects"] = sum(course["ECTS"] for _, course in self.combo(rank))
+        if self._penalty_terms:
+            penalty = 0.0
+            for name, weight, minv, maxv in self._penalty_terms:
+                if maxv - minv > 0:
+                    penalty += weight * ((summary[name] - minv) / (maxv - minv))
+            summary["total_penalty"] = penalty
+        return summary
+
+    @property
+    def nbytes(self):
+        columns = [self.masks, self.order, *self.metrics.values()]
+        return sum(c.itemsize * len(c) for c in columns)
@@ -5,6 +5,7 @@ import matplotlib.pyplot as plt
 from itertools import combinations
 from matplotlib.colors import ListedColormap
 
+from schedule_results import ScheduleResults, TooManyCoursesError
 from db import init_db, get_db_session
 from auth import register_user, authenticate_user, save_schedule_for_user
 from sqlalchemy.orm import Session
@@ -134,13 +135,13 @@ def total_credits(course_combination):
 def generate_valid_schedules(courses, min_credits, max_credits, max_days,
                              mandatory_courses, excluded_courses,
                              no_conflicts, uni_day_rule, max_6_consecutive):
-    valid = []
     items = [(code, c) for code, c in courses.items() if code not in excluded_courses]
+    valid = ScheduleResults(items)
+    bits = [1 << i for i in range(len(items))]
     mandatory_set = set(mandatory_courses)
-    from itertools import combinations
     N = len(items)
     for r in range(len(mandatory_courses), N+1):
-        for combo in combinations(items, r):
+        for combo, combo_bits in zip(combinations(items, r), combinations(bits, r)):
             combo_codes = set(code for code, _ in combo)
             if not mandatory_set.issubset(combo_codes):
                 continue
@@ -160,16 +161,16 @@ def generate_valid_schedules(courses, min_credits, max_credits, max_days,
             
             days = get_number_of_class_days(combo)
             if days <= max_days:
-                valid.append({
-                    "combo": combo,
-                    "num_days": days,
-                    "gap_time": total_gap_time(combo),
-                    "max_consec": mc,
-                    "total_hours": total_class_hours(combo),
-                    "total_ects": total_credits(combo),
-                    "earliest_start": earliest_start_time(combo),
-                    "latest_end": latest_end_time(combo),
-                })
+                valid.append(
+                    sum(combo_bits),
+                    num_days=days,
+                    gap_time=total_gap_time(combo),
+                    max_consec=mc,
+                    total_hours=total_class_hours(combo),
+                    total_ects=total_credits(combo),
+                    earliest_start=earliest_start_time(combo),
+                    latest_end=latest_end_time(combo),
+                )
     return valid
 
 def plot_schedule(course_combination):
@@ -356,7 +357,6 @@ def main():
         return
     # Normalize
     penalty_list = [p / total_penalty for p in penalty_list]
-    p_days, p_gap, p_consec, p_early, p_late = penalty_list
 
     # -----------------------------
     # Filter data
@@ -368,56 +368,33 @@ def main():
     # -----------------------------
     # Generate valid schedules
     # -----------------------------
-    schedules = generate_valid_schedules(
-        filtered_data,
-        min_credits,
-        max_credits,
-        max_days,
-        mandatory,
-        excluded,
-        no_conflicts,
-        uni_day_rule,
-        max_6_consecutive
-    )
+    try:
+        schedules = generate_valid_schedules(
+            filtered_data,
+            min_credits,
+            max_credits,
+            max_days,
+            mandatory,
+            excluded,
+            no_conflicts,
+            uni_day_rule,
+            max_6_consecutive
+        )
+    except TooManyCoursesError as e:
+        st.error(str(e))
+        return
     if not schedules:
         st.warning("No valid schedules found with these filters.")
         return
 
-    # Prepare normalization for sorting
-    d_values = [s["num_days"] for s in schedules]
-    g_values = [s["gap_time"] for s in schedules]
-    c_values = [s["max_consec"] for s in schedules]
-    e_values = [s["earliest_start"] for s in schedules]
-    l_values = [s["latest_end"] for s in schedules]
-
-    def normalize(val, minv, maxv, reverse=False):
-        if maxv - minv > 0:
-            norm = (val - minv)/(maxv - minv)
-            return (1 - norm) if reverse else norm
-        else:
-            return 0
-
-    for s in schedules:
-        s["norm_num_days"] = normalize(s["num_days"], min(d_values), max(d_values))
-        s["norm_gap_time"] = normalize(s["gap_time"], min(g_values), max(g_values))
-        s["norm_max_consec"] = normalize(s["max_consec"], min(c_values), max(c_values))
-        s["norm_earliest_start"] = normalize(s["earliest_start"], min(e_values), max(e_values))
-        s["norm_latest_end"] = normalize(s["latest_end"], min(l_values), max(l_values))
-        s["total_penalty"] = (
-            p_days * s["norm_num_days"] +
-            p_gap * s["norm_gap_time"] +
-            p_consec * s["norm_max_consec"] +
-            p_early * s["norm_earliest_start"] +
-            p_late * s["norm_latest_end"]
-        )
-
     if "schedule_index" not in st.session_state:
         st.session_state["schedule_index"] = 0
     
-    # Sort by penalty ascending
-    schedules.sort(key=lambda x: x["total_penalty"])
+    # Normalize metrics and sort by penalty ascending
+    schedules.rank(penalty_list)
     idx = st.session_state["schedule_index"]
-    selected = schedules[idx]
+    selected = schedules.summary(idx)
+    selected_combo = schedules.combo(idx)
 
     st.success(f"Found {len(schedules)} valid schedules.")
     prev_col, next_col, space_col, save_col = st.columns([2, 2, 3, 2])
@@ -440,7 +417,7 @@ def main():
                 # We'll store just the course codes + some summary
                 # so we can reconstruct them on the "SavedCourses" page
                 schedule_data = {
-                    "course_codes": [c[0] for c in selected["combo"]],
+                    "course_codes": [c[0] for c in selected_combo],
                     "metrics": {
                         "num_days": selected["num_days"],
                         "gap_time": selected["gap_time"],
@@ -465,13 +442,13 @@ def main():
             
     st.write(f"Schedule {idx+1} / {len(schedules)}")
 
-    fig = plot_schedule(selected["combo"])
+    fig = plot_schedule(selected_combo)
     st.pyplot(fig)
     
     
     st.write(f"**Total ECTS:** {selected['total_ects']}")
     st.write("**Courses in Schedule:**")
-    for code, course in selected["combo"]:
+    for code, course in selected_combo:
         # Add the clickable syllabus link using MBM-{code} pattern
         st.write(
             f"- **{code}** ({course['University']}): {course['ECTS']} ECTS "
@@ -0,0 +1,144 @@
+import random
+import tracemalloc
+
+import pytest
+
+from schedule_results import (
+    MAX_COURSES,
+    PENALTY_METRICS,
+    ScheduleResults,
+    TooManyCoursesError,
+)
+
+N_ROWS = 100_000
+N_DICT_ROWS = 10_000  # the old layout is sampled and scaled to N_ROWS
+
+COURSES = [
+    ("AAA", {"University": "UPC", "ECTS": 5}),
+    ("BBB", {"University": "UPC", "ECTS": 4.5}),
+    ("CCC", {"University": "UB", "ECTS": 6}),
+    ("DDD", {"University": "URV", "ECTS": 3}),
+]
+
+
+def random_metrics(rng):
+    return {
+        "num_days": rng.randint(1, 5),
+        "gap_time": rng.randint(-3, 6),
+        "max_consec": rng.randint(1, 6),
+        "total_hours": rng.randint(4, 24),
+        "total_ects": rng.choice([29.5, 30, 30.5, 31]),
+        "earliest_start": rng.randint(8, 12),
+        "latest_end": rng.randint(14, 20),
+    }
+
+
+def old_rank(rows, weights):
+    """The dict-per-row normalize-and-sort that main() used to do."""
+    values = {name: [r[name] for r in rows] for name in PENALTY_METRICS}
+
+    def normalize(val, minv, maxv):
+        if maxv - minv > 0:
+            return (val - minv)/(maxv - minv)
+        return 0
+
+    for r in rows:
+        r["total_penalty"] = sum(
+            w * normalize(r[name], min(values[name]), max(values[name]))
+            for name, w in zip(PENALTY_METRICS, weights)
+        )
+    return sorted(rows, key=lambda r: r["total_penalty"])
+
+
+def test_rank_matches_old_sort():
+    rng = random.Random(0)
+    weights = [0.1, 0.3, 0.2, 0.25, 0.15]
+    results = ScheduleResults(COURSES)
+    rows = []
+    for i in range(500):
+        metrics = random_metrics(rng)
+        results.append(rng.getrandbits(len(COURSES)), **metrics)
+        rows.append(dict(metrics, row=i))
+
+    results.rank(weights)
+    expected = old_rank(rows, weights)
+
+    assert list(results.order) == [r["row"] for r in expected]
+    for rank in (0, 17, 499):
+        assert results.summary(rank)["total_penalty"] == expected[rank]["total_penalty"]
+
+
+def test_combo_rebuilds_pairs_from_mask():
+    results = ScheduleResults(COURSES)
+    results.append(0b1010, **random_metrics(random.Random(1)))
+    results.append(0b0101, **random_metrics(random.Random(2)))
+
+    assert results.combo(0) == (COURSES[1], COURSES[3])
+    assert results.combo(1) == (COURSES[0], COURSES[2])
+    assert results.combo(0)[0][1] is COURSES[1][1]
+
+
+def test_summary_keeps_python_values():
+    results = ScheduleResults(COURSES)
+    results.append(0b0101, **random_metrics(random.Random(3)))
+    results.rank([0.2] * 5)
+
+    summary = results.summary(0)
+    assert summary["total_ects"] == 11
+    assert isinstance(summary["total_ects"], int)
+    assert summary["total_penalty"] == 0.0
+
+
+def test_column_is_readonly_view():
+    results = ScheduleResults(COURSES)
+    results.append(0b1, **dict(random_metrics(random.Random(4)), gap_time=-200))
+
+    view = results.column("gap_time")
+    assert view.tolist() == [-200]
+    assert view.readonly
+    assert view.obj is results.metrics["gap_time"]
+
+
+def test_too_many_courses():
+    items = [(f"C{i}", {"ECTS": 1}) for i in range(MAX_COURSES + 1)]
+    with pytest.raises(TooManyCoursesError):
+        ScheduleResults(items)
+
+
+def test_memory_footprint_per_100k(record_property):
+    rng = random.Random(5)
+    masks = [rng.getrandbits(len(COURSES)) or 1 for _ in range(N_ROWS)]
+    metrics = random_metrics(rng)
+
+    tracemalloc.start()
+    results = ScheduleResults(COURSES)
+    for mask in masks:
+        results.append(mask, **metrics)
+    results.rank([0.2] * 5)
+    columnar_traced = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # Old layout: one dict per schedule holding its own combo tuple, the raw
+    # metrics and the five norm_* fields plus total_penalty added by main()
+    tracemalloc.start()
+    rows = []
+    for mask in masks[:N_DICT_ROWS]:
+        combo = tuple(c for bit, c in enumerate(COURSES) if mask >> bit & 1)
+        row = dict(metrics, combo=combo)
+        for name in PENALTY_METRICS:
+            row["norm_" + name] = rng.random()
+        row["total_penalty"] = rng.random()
+        rows.append(row)
+    dict_traced = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    dict_bytes = dict_traced * N_ROWS // N_DICT_ROWS
+
+    record_property("columnar_bytes_per_100k", results.nbytes)
+    record_property("columnar_bytes_per_row", results.nbytes / N_ROWS)
+    record_property("dict_bytes_per_100k", dict_bytes)
+    record_property("dict_bytes_per_row", dict_bytes / N_ROWS)
+
+    assert results.nbytes == 24 * N_ROWS
+    assert columnar_traced < 2 * results.nbytes
+    assert results.nbytes * 10 < dict_bytes